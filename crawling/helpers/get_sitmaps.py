@@ -1,38 +1,50 @@
+from concurrent.futures import ThreadPoolExecutor
 from trafilatura import sitemaps
 from pathlib import Path
+from urllib.parse import urlsplit
 import sys
 
 # ---------------------
 # Utilization:
 # python helpers/get_sitmaps.py
 # this will append the sitemap links to the file.txt file
+# origins are the first line plus any other site root URL (e.g. https://example.com/) in the file,
+# they are searched in parallel and links already present in the file are not appended again
 
 CRAWLING_DIR = Path(__file__).resolve().parents[1]
 LINKS_FILE = CRAWLING_DIR / "file.txt"
+MAX_WORKERS = 16
 
 if not LINKS_FILE.exists():
     print(f"File not found: {LINKS_FILE}")
     sys.exit(1)
 
-# Read origin URL
+# Read origin URLs
 with LINKS_FILE.open("r", encoding="utf-8") as f:
-    origin_url = f.readline().strip()
+    lines = [line.strip() for line in f]
 
-if not origin_url:
+if not lines or not lines[0]:
     print("First line (origin URL) is empty")
     sys.exit(1)
 
-# Ensure newline after first line
+urls = [line for line in lines if line and not line.startswith("#")]
+origins = list(dict.fromkeys([lines[0]] + [url for url in urls if urlsplit(url).path in ("", "/")]))
+
+# Ensure newline after last line
 content = LINKS_FILE.read_text(encoding="utf-8")
 if not content.endswith("\n"):
     LINKS_FILE.write_text(content + "\n", encoding="utf-8")
 
-# Fetch sitemaps
-mylinks = sitemaps.sitemap_search(origin_url)
+# Fetch sitemaps (I/O bound, one thread per origin)
+with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(origins))) as executor:
+    results = list(executor.map(sitemaps.sitemap_search, origins))
 
-# Append sitemap links
+# Append sitemap links, skipping duplicates and links already in the file
+seen = set(urls)
 with LINKS_FILE.open("a", encoding="utf-8") as f:
-    for link in mylinks:
-        f.write(link + "\n")
-
-print(f"Appended {len(mylinks)} sitemap links for {origin_url}")
+    for origin_url, mylinks in zip(origins, results):
+        new_links = [link for link in dict.fromkeys(mylinks) if link not in seen]
+        seen.update(new_links)
+        for link in new_links:
+            f.write(link + "\n")
+        print(f"Appended {len(new_links)} sitemap links for {origin_url}")
@@ -0,0 +1,29 @@
+import json
+from pathlib import Path
+
+stats_path = Path(__file__).parent.parent.parent / "output" / "log" / "stats.json"
+
+def filter_costs(stats_path=stats_path):
+    """
+    Read the per-step stats datatrove writes after a run and return, for each filter,
+    its mean cost per document, its reject rate and the cost / reject rate ratio.
+    Filters that don't rewrite the text can be ordered by ascending ratio:
+    cheap filters that reject a lot should run first.
+    """
+    with open(stats_path) as f:
+        steps = json.load(f)
+
+    costs = []
+    for step in steps:
+        stats = step["stats"]
+        if "FILTER" not in step["name"] or not stats.get("total"):
+            continue
+        mean_cost = step["time_stats"]["total"] / stats["total"]
+        reject_rate = stats.get("dropped", 0) / stats["total"]
+        ratio = mean_cost / reject_rate if reject_rate else float("inf")
+        costs.append((step["name"], mean_cost, reject_rate, ratio))
+    return sorted(costs, key=lambda cost: cost[3])
+
+if __name__ == "__main__":
+    for name, mean_cost, reject_rate, ratio in filter_costs():
+        print(f"{name:<50} {mean_cost * 1000:8.3f} ms/doc  {reject_rate:6.1%} rejected  {ratio * 1000:10.3f} ms/reject")
@@ -2,10 +2,39 @@ from transformers import AutoTokenizer
 from pathlib import Path
 
 model_cache_path=Path(__file__).parent.parent.parent.parent / "models_cache"
-
-# Download GPT-2 tokenizer to local path
 tokenizer_path = model_cache_path / "aragpt2_base_tokenizer"
-tokenizer_path.mkdir(parents=True, exist_ok=True)
 
-tokenizer = AutoTokenizer.from_pretrained("aubmindlab/aragpt2-base")
-tokenizer.save_pretrained(str(tokenizer_path))
\ No newline at end of file
+def ensure_tokenizer():
+    """
+    Download (if needed) and load the AraGPT2 fast tokenizer.
+    The tokenizer is saved under models_cache/ and only downloaded when missing.
+    """
+    if (tokenizer_path / "tokenizer.json").exists():
+        return AutoTokenizer.from_pretrained(str(tokenizer_path), use_fast=True)
+
+    # Download GPT-2 tokenizer to local path
+    tokenizer_path.mkdir(parents=True, exist_ok=True)
+    tokenizer = AutoTokenizer.from_pretrained("aubmindlab/aragpt2-base", use_fast=True)
+    tokenizer.save_pretrained(str(tokenizer_path))
+    return tokenizer
+
+def count_tokens_batched(tokenizer, texts, batch_size=1000):
+    """
+    Count the tokens of each text, tokenizing `batch_size` texts per call.
+    Batched calls avoid the per-text Python <-> Rust overhead of fast tokenizers,
+    use this instead of [len(tokenizer.tokenize(t)) for t in texts].
+    """
+    token_counts = []
+    for i in range(0, len(texts), batch_size):
+        encoded = tokenizer(
+            texts[i : i + batch_size],
+            add_special_tokens=False,
+            return_length=True,
+            padding=False,
+            truncation=False,
+        )
+        token_counts.extend(encoded["length"])
+    return token_counts
+
+if __name__ == "__main__":
+    ensure_tokenizer()
@@ -1,13 +1,17 @@
-import gzip
-import json
+try:
+    from isal import igzip as gzip  # ISA-L decompression, drop-in replacement for gzip
+except ImportError:
+    import gzip
+import orjson
 from pathlib import Path
 
 jsonl_path = Path(__file__).parent.parent.parent / "output" / "data" / "00000.jsonl.gz"
 #jsonl_path = Path(__file__).parent.parent.parent / "output" / "rejected" / "5_fineweb_qual" / "00000.jsonl.gz"
 
-with gzip.open(jsonl_path, "rt", encoding="utf-8") as f:
+# orjson parses the raw bytes directly, no need to decode the lines first
+with gzip.open(jsonl_path, "rb") as f:
     for i, line in enumerate(f):
-        doc = json.loads(line)
+        doc = orjson.loads(line)
         print("#" * 80)
         print("Tokens:", doc.get("metadata", {}).get("token_count"))
         print("Text preview:")
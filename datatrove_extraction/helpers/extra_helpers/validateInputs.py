@@ -1,11 +1,22 @@
+import os
 from pathlib import Path
 
 def validate_inputs():
+    """
+    Check that input/ contains WARC files and that output/ can be created.
+    Returns the sorted paths of the WARC files, so callers don't need to list them again.
+    """
     input_dir = Path(__file__).parent.parent.parent / "input"
     if not input_dir.exists():
         raise FileNotFoundError(f"Input directory not found: {input_dir}")
     
-    warc_files = [file for file in input_dir.glob("*.warc.gz") if file.is_file()]
+    # DirEntry.is_file() reuses the file type returned by readdir, so only symlinks need a stat()
+    with os.scandir(input_dir) as entries:
+        warc_files = sorted(
+            entry.path
+            for entry in entries
+            if entry.name.endswith(".warc.gz") and not entry.name.startswith(".") and entry.is_file()
+        )
     if not warc_files:
         raise ValueError(f"No WARC files found in {input_dir}")
     
@@ -15,4 +26,5 @@ def validate_inputs():
     
     num_files = len(warc_files)
     print(f"Found {num_files} WARC files to process")
+    return warc_files
 
@@ -53,16 +53,19 @@ class ArabicNormalizationFilter(BaseFilter):
         self.normalize_numbers = normalize_numbers
         self.preserve_newlines = preserve_newlines
         
-        # Compile regex patterns for performance
+        # Every character-level step is a 1-to-{0,1} character mapping, so they are all
+        # merged into one translation table and applied with a single str.translate pass
+        self.trans_table = {}
         if remove_diacritics:
             # Arabic diacritics (tashkeel): Fathatan, Dammatan, Kasratan, Fatha, Damma, Kasra, etc.
-            self.diacritics_regex = re.compile(r'[\u064B-\u065F\u0670]')
+            # \u064B-\u065F, \u0670
+            self.trans_table.update(dict.fromkeys([*range(0x064B, 0x0660), 0x0670]))
         
         if normalize_arabic_chars:
             # Normalize alef variations to standard alef (ا)
             # آ (U+0622 - Alef with Madda), أ (U+0623 - Alef with Hamza above)
             # إ (U+0625 - Alef with Hamza below), ٱ (U+0671 - Alef wasla)
-            self.alef_variations = re.compile(r'[\u0622\u0623\u0625\u0671]')
+            self.trans_table.update(dict.fromkeys([0x0622, 0x0623, 0x0625, 0x0671], 0x0627))
         
         if remove_zero_width:
             # Zero-width characters:
@@ -71,18 +74,21 @@ class ArabicNormalizationFilter(BaseFilter):
             # \u200E, \u200F: LRM, RLM (left-to-right/right-to-left marks)
             # \u202A-\u202E: Directional formatting marks
             # \u2066-\u2069: Additional directional isolates
-            self.zero_width_regex = re.compile(
-                r'[\u200B-\u200D\uFEFF\u200E\u200F\u202A-\u202E\u2066-\u2069]'
+            self.trans_table.update(
+                dict.fromkeys([*range(0x200B, 0x200E), 0xFEFF, 0x200E, 0x200F, *range(0x202A, 0x202F), *range(0x2066, 0x206A)])
             )
         
         if remove_tatweel:
             # Tatweel (elongation character): ـ (U+0640)
-            self.tatweel_regex = re.compile(r'\u0640')
+            self.trans_table[0x0640] = None
         
         if normalize_numbers:
-            # Create translation table for Eastern Arabic to Western numerals
+            # Eastern Arabic to Western numerals
             # ٠١٢٣٤٥٦٧٨٩ → 0123456789
-            self.arabic_to_western = str.maketrans('٠١٢٣٤٥٦٧٨٩', '0123456789')
+            self.trans_table.update(str.maketrans('٠١٢٣٤٥٦٧٨٩', '0123456789'))
+        
+        # Whitespace collapsing still needs a regex
+        self.whitespace_regex = re.compile(r'[ \t]+' if preserve_newlines else r'\s+')
 
     def filter(self, doc: Document) -> bool | tuple[bool, str]:
         """Normalize Arabic text in document.
@@ -108,33 +114,14 @@ class ArabicNormalizationFilter(BaseFilter):
         if 'original_text_normalized' not in doc.metadata:
             doc.metadata['original_text_normalized'] = text
         
-        # Step 1: Remove diacritics (tashkeel)
-        if self.remove_diacritics:
-            text = self.diacritics_regex.sub('', text)
-        
-        # Step 2: Normalize Arabic characters (alef variations to standard alef)
-        if self.normalize_arabic_chars:
-            text = self.alef_variations.sub('\u0627', text)  # Standard alef (ا)
-        
-        # Step 3: Remove zero-width characters
-        if self.remove_zero_width:
-            text = self.zero_width_regex.sub('', text)
-        
-        # Step 4: Remove tatweel (elongation)
-        if self.remove_tatweel:
-            text = self.tatweel_regex.sub('', text)
-        
-        # Step 5: Normalize numbers (optional - usually keep Arabic numbers)
-        if self.normalize_numbers:
-            text = text.translate(self.arabic_to_western)
+        # Steps 1-5: Diacritics, alef variations, zero-width characters, tatweel and numbers in one pass
+        if self.trans_table:
+            text = text.translate(self.trans_table)
         
         # Step 6: Normalize whitespace
         if self.normalize_whitespace:
-            if self.preserve_newlines:
-                text = re.sub(r'[ \t]+', ' ', text)
-            else:
-                # Normalize all whitespace (including newlines)
-                text = re.sub(r'\s+', ' ', text)
+            # Only spaces/tabs when preserving newlines, all whitespace otherwise
+            text = self.whitespace_regex.sub(' ', text)
             text = text.strip()
         
         # Update document text
@@ -143,9 +130,7 @@ class ArabicNormalizationFilter(BaseFilter):
         # Check if document is empty after normalization
         if not doc.text or len(doc.text.strip()) == 0:
             self.stat_update("empty_after_normalization")
-            # Write rejected document to exclusion writer
-            if self.exclusion_writer:
-                self.exclusion_writer.write(doc, rank=0)
+            # BaseFilter.run writes it to the exclusion writer, under the rank of the task
             return False, "empty_after_normalization"
         
         return True
\ No newline at end of file
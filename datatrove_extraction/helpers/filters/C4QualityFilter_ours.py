@@ -1,11 +1,14 @@
 import re
 
+import ahocorasick
 from datatrove.data import Document
 from datatrove.pipeline.filters.base_filter import BaseFilter
 from datatrove.pipeline.writers.disk_base import DiskWriter
 from datatrove.utils.text import split_into_sentences
 from datatrove.utils.typeshelper import Languages
 
+from .PrecomputeTextStats import get_text_stats
+
 
 CITATION_REGEX = re.compile(r"\[\d*]|\[edit]|\[citation needed]")
 END_PUNCTUATION = (".", "؟", "!", ":", "?", "'", '"')  # Added Arabic punctuation marks
@@ -37,6 +40,16 @@ PLACEHOLDER_PATTERNS = [
     "lorem ipsum"
 ]
 
+# Single Aho-Corasick automaton over both substring lists, each pattern tagged with its category,
+# so one walk over a line tells whether it contains a placeholder and/or a policy phrase
+POLICY = "policy"
+PLACEHOLDER = "placeholder"
+SUBSTRINGS_AUTOMATON = ahocorasick.Automaton()
+for _category, _patterns in ((POLICY, POLICY_SUBSTRINGS), (PLACEHOLDER, PLACEHOLDER_PATTERNS)):
+    for _pattern in _patterns:
+        SUBSTRINGS_AUTOMATON.add_word(_pattern, _category)
+SUBSTRINGS_AUTOMATON.make_automaton()
+
 
 class C4QualityFilter(BaseFilter):
     """Applies heuristic rules from C4 https://jmlr.org/papers/volume21/20-074/20-074.pdf
@@ -103,35 +116,43 @@ class C4QualityFilter(BaseFilter):
         self.language = language
 
     def filter(self, doc: Document) -> bool | tuple[bool, str]:
-        lines = doc.text.splitlines() if self.split_paragraph else split_into_sentences(doc.text, self.language)
+        if self.split_paragraph:
+            # Reuse the lines from PrecomputeTextStats when available
+            stats = get_text_stats(doc)
+            lines = stats.lines if stats is not None else doc.text.splitlines()
+        else:
+            lines = split_into_sentences(doc.text, self.language)
 
         num_sentences = 0
         kept_lines = []
 
         for line in lines:
             line = line.strip()
-            
-            words = line.split()
             self.stat_update("line-total")
-            # check line has too long word
-            if self.max_word_length != -1 and any(len(word) > self.max_word_length for word in words):
-                self.stat_update("line-filter-too_long_word")
-                continue
-            # remove citation
+            # remove citation first so that the line only needs to be split once
             if self.remove_citations:
                 line = CITATION_REGEX.sub("", line)
             # end punctuation
             if self.filter_no_terminal_punct and (not line.endswith(END_PUNCTUATION) or line.endswith(ELLIPSIS)):
                 self.stat_update("line-filter-no_terminal_punc")
                 continue
+            words = line.split()
+            # check line has too long word
+            if self.max_word_length != -1 and any(len(word) > self.max_word_length for word in words):
+                self.stat_update("line-filter-too_long_word")
+                continue
             # min words per line (applied after citation removal)
-            words = line.split()  # Re-split after citation removal
             if self.min_words_per_line != -1 and len(words) < self.min_words_per_line:
                 self.stat_update("line-filter-too_few_words")
                 continue
             line_l = line.lower()
+            found = (
+                {category for _, category in SUBSTRINGS_AUTOMATON.iter(line_l)}
+                if self.filter_lorem_ipsum or self.filter_policy
+                else set()
+            )
             # placeholder text (expanded for Arabic)
-            if self.filter_lorem_ipsum and any(placeholder in line_l for placeholder in PLACEHOLDER_PATTERNS):
+            if self.filter_lorem_ipsum and PLACEHOLDER in found:
                 return False, "lorem_ipsum"  # drop entire doc
             # javascript
             if self.filter_javascript and "javascript" in line_l:
@@ -141,7 +162,7 @@ class C4QualityFilter(BaseFilter):
             if self.filter_curly_bracket and "{" in line:
                 return False, "curly_bracket"  # drop entire doc
             # policy
-            if self.filter_policy and any(p in line_l for p in POLICY_SUBSTRINGS):
+            if self.filter_policy and POLICY in found:
                 self.stat_update("line-filter-policy")
                 continue
             if self.min_num_sentences != -1:
@@ -0,0 +1,27 @@
+from datatrove.data import Document
+from datatrove.pipeline.filters.base_filter import BaseFilter
+from datatrove.pipeline.writers.disk_base import DiskWriter
+
+
+class EmptyDocFilter(BaseFilter):
+    """Drop empty or near-empty extractions before any normalization or quality filter runs on them.
+
+    Place it right after Trafilatura. With the default GopherQualityFilter settings (at least 15
+    words of 2 characters on average) a text under 30 characters is always rejected anyway, but
+    only after tokenization; here it costs one strip() per document.
+
+    Args:
+        exclusion_writer: optionally pass in a writer that will save the dropped documents
+        min_chars: minimum number of characters of the text, leading/trailing whitespace excluded
+    """
+
+    name = "🫙 Empty Doc"
+
+    def __init__(self, exclusion_writer: DiskWriter | None = None, min_chars: int = 30):
+        super().__init__(exclusion_writer)
+        self.min_chars = min_chars
+
+    def filter(self, doc: Document) -> bool | tuple[bool, str]:
+        if len(doc.text.strip()) < self.min_chars:
+            return False, "empty_doc"
+        return True
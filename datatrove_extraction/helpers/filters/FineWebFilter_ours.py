@@ -4,7 +4,7 @@ from datatrove.data import Document
 from datatrove.pipeline.filters.base_filter import BaseFilter
 from datatrove.pipeline.filters.gopher_repetition_filter import find_duplicates
 from datatrove.pipeline.writers.disk_base import DiskWriter
-from datatrove.utils.text import split_into_words, TERMINAL_PUNCTUATION
+from datatrove.utils.text import TERMINAL_PUNCTUATION
 from datatrove.utils.typeshelper import Languages
 
 class FineWebQualityFilter(BaseFilter):
@@ -26,6 +26,10 @@ class FineWebQualityFilter(BaseFilter):
         self.line_punct_thr = line_punct_thr
         self.line_punct_exclude_zero = line_punct_exclude_zero
         self.stop_chars = stop_chars if stop_chars is not None else tuple(TERMINAL_PUNCTUATION)
+        # Single-char stop chars are matched with a set lookup on the last character of each line,
+        # longer ones (e.g. "...") fall back to str.endswith
+        self.single_char_stop_chars = frozenset(c for c in self.stop_chars if len(c) == 1)
+        self.multi_char_stop_chars = tuple(c for c in self.stop_chars if len(c) > 1)
         self.short_line_threshold = short_line_thr
         self.short_line_length = short_line_length
         self.char_duplicates_ratio = char_duplicates_ratio
@@ -33,34 +37,45 @@ class FineWebQualityFilter(BaseFilter):
         self.language = language
 
     def filter(self, doc) -> bool | tuple[bool, str]:
-        lines = doc.text.split("\n")
-        lines = [line for line in lines if line.strip() != ""]
-        if len(lines) == 0:
+        # Split once: newline count and text length without newlines are derived from it
+        all_lines = doc.text.split("\n")
+        n_newlines = len(all_lines) - 1
+        lines = [line for line in all_lines if line.strip() != ""]
+        n_lines = len(lines)
+        if n_lines == 0:
             return False, "empty"
-        ratio = sum(1 for line in lines if line.endswith(self.stop_chars)) / len(lines)
-        if ratio < self.line_punct_thr and not (ratio == 0 and self.line_punct_exclude_zero):
+        # Ratio checks below compare a count against threshold * total, so no division is needed
+        # Lines are non-empty here, so every line has a last character
+        single_char_stop_chars = self.single_char_stop_chars
+        multi_char_stop_chars = self.multi_char_stop_chars
+        if multi_char_stop_chars:
+            n_stop_lines = sum(
+                line[-1] in single_char_stop_chars or line.endswith(multi_char_stop_chars) for line in lines
+            )
+        else:
+            n_stop_lines = sum(line[-1] in single_char_stop_chars for line in lines)
+        if n_stop_lines < self.line_punct_thr * n_lines and not (n_stop_lines == 0 and self.line_punct_exclude_zero):
             return False, "line_punct_ratio"
 
-        ratio = sum(1 for line in lines if len(line) <= self.short_line_length) / len(lines)
-        if ratio > self.short_line_threshold:
+        short_line_length = self.short_line_length
+        n_short_lines = sum(len(line) <= short_line_length for line in lines)
+        if n_short_lines > self.short_line_threshold * n_lines:
             return False, "short_line_ratio"
 
-        text_without_newlines = doc.text.replace("\n", "")
-        if len(text_without_newlines) == 0:
+        n_chars_without_newlines = len(doc.text) - n_newlines
+        if n_chars_without_newlines == 0:
             return False, "empty_after_newline_removal"
 
-        ratio = find_duplicates(lines)[1] / len(text_without_newlines)
-
-        if ratio > self.char_duplicates_ratio:
+        if find_duplicates(lines)[1] > self.char_duplicates_ratio * n_chars_without_newlines:
             return False, "char_dup_ratio"
 
-        words = split_into_words(doc.text, self.language)
-        if len(words) == 0:
+        # Count-only approximation: the newline-to-word ratio only needs the number of words,
+        # so a whitespace split is used instead of the language-specific word tokenizer
+        n_words = len(doc.text.split())
+        if n_words == 0:
             return False, "no_words"
 
-        new_line = doc.text.count("\n")
-        new_line_ratio = new_line / len(words) if len(words) > 0 else float('inf')
-        if new_line_ratio > self.new_line_ratio:
+        if n_newlines > self.new_line_ratio * n_words:
             return False, "list_ratio"
 
         return True
\ No newline at end of file
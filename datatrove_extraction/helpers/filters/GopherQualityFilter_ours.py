@@ -3,11 +3,17 @@ import numpy as np
 from datatrove.data import Document
 from datatrove.pipeline.filters.base_filter import BaseFilter
 from datatrove.pipeline.writers.disk_base import DiskWriter
-from datatrove.utils.text import PUNCTUATION_SET, split_into_words
 from datatrove.utils.typeshelper import Languages
 
+from ._gopher_stats import word_flags
+from .PrecomputeTextStats import get_text_stats, split_into_words_cached
 
 
+def _segment_sums(values: np.ndarray, segment_lengths: np.ndarray) -> np.ndarray:
+    """Sum `values` over consecutive segments of the given lengths (empty segments sum to 0)"""
+    cumsum = np.concatenate(([0], np.cumsum(values, dtype=np.int64)))
+    ends = np.cumsum(segment_lengths)
+    return cumsum[ends] - cumsum[ends - segment_lengths]
 
 
 class GopherQualityFilter(BaseFilter):
@@ -26,6 +32,7 @@ class GopherQualityFilter(BaseFilter):
     
         exclusion_writer: DiskWriter = None,
         language: str = Languages.moroccan_arabic ,  # Utilise arabic pour l'analyse
+        batch_size: int = 1000,
     ):
         """
         Filter to apply Gopher's quality heuristic rules for Darija (Moroccan Arabic).
@@ -44,8 +51,9 @@ class GopherQualityFilter(BaseFilter):
             max_non_alpha_words_ratio: Maximum non-alpha words ratio (default: 0.75)
             exclusion_writer: Writer for excluded documents
             language: Language code for tokenization
+            batch_size: Number of documents handed to filter_batch at once (default: 1000)
         """
-        super().__init__(exclusion_writer)
+        super().__init__(exclusion_writer, batch_size=batch_size)
         self.min_doc_words = min_doc_words
         self.max_doc_words = max_doc_words
         self.min_avg_word_length = min_avg_word_length
@@ -57,17 +65,6 @@ class GopherQualityFilter(BaseFilter):
        
         self.language = language
 
-    def _is_arabic_char(self, char: str) -> bool:
-        """Check if character is Arabic script"""
-        arabic_ranges = [
-            (0x0600, 0x06FF),  # Arabic
-            (0x0750, 0x077F),  # Arabic Supplement
-            (0x08A0, 0x08FF),  # Arabic Extended-A
-        ]
-        code = ord(char)
-        return any(start <= code <= end for start, end in arabic_ranges)
-
-
     def filter(self, doc: Document) -> bool | tuple[bool, str]:
         """
         Applies the heuristics rules to decide if a document should be REMOVED
@@ -79,66 +76,119 @@ class GopherQualityFilter(BaseFilter):
             True if document passes filter (keep it)
             False with reason if document fails filter (remove it)
         """
-        text = doc.text
-        
-        words = split_into_words(text, self.language)
-        n_words = len(words)
+        return self.filter_batch([doc])[0]
+
+    def filter_batch(self, batch: list[Document]) -> list[bool | tuple[bool, str]]:
+        """
+        Applies the heuristics rules to a whole batch of documents.
+
+        Words are still split per document, but the word statistics of the whole
+        batch (lengths, alphabetic words) are computed at once on NumPy arrays.
 
+        Args:
+            batch: Documents to filter
+
+        Returns:
+            One filter result per document, in the same order as `batch`
+        """
+        texts = [doc.text for doc in batch]
+        batch_lines = []
+        batch_words = []
+        too_short = []
+        for doc in batch:
+            # Reuse the splits from PrecomputeTextStats when available
+            stats = get_text_stats(doc)
+            if stats is not None and stats.language == self.language:
+                batch_lines.append(stats.lines)
+                batch_words.append(stats.words)
+                too_short.append(False)
+            elif self.min_doc_words and len(doc.text) < self.min_doc_words and doc.text.strip():
+                # Words are non-empty, disjoint substrings of the text, so a text shorter than
+                # min_doc_words characters is a short doc: skip the tokenizer for it.
+                # Blank texts still go through it and are rejected as gopher_no_words.
+                batch_lines.append(None)
+                batch_words.append([])
+                too_short.append(True)
+            else:
+                batch_lines.append(None)
+                batch_words.append(split_into_words_cached(doc.text, self.language))
+                too_short.append(False)
+        words = [w for doc_words in batch_words for w in doc_words]
+        n_words = np.fromiter(map(len, batch_words), dtype=np.int64, count=len(batch))
+        word_lengths = np.fromiter(map(len, words), dtype=np.int64, count=len(words))
+
+        # Words made only of punctuation are left out of the length statistics
+        is_non_symbol, is_alpha = word_flags(words, word_lengths)
+        n_non_symbol_words = _segment_sums(is_non_symbol, n_words)
+        total_word_lengths = _segment_sums(word_lengths * is_non_symbol, n_words)
+        n_alpha_words = _segment_sums(is_alpha, n_words)
+
+        return [
+            (False, "gopher_short_doc") if short else self._filter_text(text, lines, *map(int, stats))
+            for text, lines, short, stats in zip(
+                texts, batch_lines, too_short, zip(n_words, n_non_symbol_words, total_word_lengths, n_alpha_words)
+            )
+        ]
+
+    def _filter_text(
+        self,
+        text: str,
+        lines: list[str] | None,
+        n_words: int,
+        n_non_symbol_words: int,
+        total_word_length: int,
+        alpha_words_count: int,
+    ) -> bool | tuple[bool, str]:
+        """Apply the heuristics to a single document, given its precomputed word statistics (and lines if known)"""
         if n_words == 0:
             return False, "gopher_no_words"
 
-        non_symbol_words = [w for w in words if any(ch not in PUNCTUATION_SET for ch in w)]
-        n_non_symbol_words = len(non_symbol_words)
-
         # Check document length
         if self.min_doc_words and n_non_symbol_words < self.min_doc_words:
             return False, "gopher_short_doc"
         if self.max_doc_words and n_non_symbol_words > self.max_doc_words:
             return False, "gopher_long_doc"
 
+        # Ratio checks below compare a count against threshold * total, so no division is needed
         # Check average word length
         if n_non_symbol_words > 0:
-            avg_n_words = np.mean([len(w) for w in non_symbol_words])
-            if self.min_avg_word_length and avg_n_words < self.min_avg_word_length:
+            if self.min_avg_word_length and total_word_length < self.min_avg_word_length * n_non_symbol_words:
                 return False, "gopher_below_avg_threshold"
-            if self.max_avg_word_length and avg_n_words > self.max_avg_word_length:
+            if self.max_avg_word_length and total_word_length > self.max_avg_word_length * n_non_symbol_words:
                 return False, "gopher_above_avg_threshold"
 
-        # Check symbol-to-word ratio (with zero-division protection)
-        if self.max_symbol_word_ratio and n_words > 0:
-            hash_ratio = text.count("#") / n_words
-            if hash_ratio > self.max_symbol_word_ratio:
+        # Check symbol-to-word ratio
+        # Each count only runs when its check is reached. Separate str.count calls are kept on
+        # purpose: a single fused regex pass over the text measured ~25x slower than all three.
+        if self.max_symbol_word_ratio:
+            max_symbols = self.max_symbol_word_ratio * n_words
+            if text.count("#") > max_symbols:
                 return False, "gopher_too_many_hashes"
-            
-            ellipsis_ratio = (text.count("...") + text.count("…")) / n_words
-            if ellipsis_ratio > self.max_symbol_word_ratio:
+
+            if text.count("...") + text.count("…") > max_symbols:
                 return False, "gopher_too_many_ellipsis"
 
         # Check bullet points and ellipsis in lines
-        lines = text.splitlines()
-        if len(lines) > 0:
-            if (
-                self.max_bullet_lines_ratio
-                and sum(s.lstrip().startswith("•") or s.lstrip().startswith("-") for s in lines) / len(lines)
-                > self.max_bullet_lines_ratio
-            ):
+        # Both counts come from a single loop over the lines, with one strip per line and a tuple
+        # prefix/suffix test; a multiline regex over the whole text was measured slower than this loop
+        if self.max_bullet_lines_ratio or self.max_ellipsis_lines_ratio:
+            if lines is None:
+                lines = text.splitlines()
+            n_lines = len(lines)
+            n_bullet_lines = n_ellipsis_lines = 0
+            for line in lines:
+                if line.lstrip().startswith(("•", "-")):
+                    n_bullet_lines += 1
+                if line.rstrip().endswith(("...", "…")):
+                    n_ellipsis_lines += 1
+            if self.max_bullet_lines_ratio and n_bullet_lines > self.max_bullet_lines_ratio * n_lines:
                 return False, "gopher_too_many_bullets"
-            if (
-                self.max_ellipsis_lines_ratio
-                and sum(s.rstrip().endswith("...") or s.rstrip().endswith("…") for s in lines) / len(lines)
-                > self.max_ellipsis_lines_ratio
-            ):
+            if self.max_ellipsis_lines_ratio and n_ellipsis_lines > self.max_ellipsis_lines_ratio * n_lines:
                 return False, "gopher_too_many_end_ellipsis"
 
-        # Calculate non-alpha words ratio correctly
-        alpha_words_count = sum([any((c.isalpha() or self._is_arabic_char(c) for c in w)) for w in words])
-        non_alpha_words_count = n_words - alpha_words_count
-        non_alpha_ratio = non_alpha_words_count / n_words if n_words > 0 else 0
-
         # Reject if non-alpha ratio exceeds threshold
-        if self.max_non_alpha_words_ratio and non_alpha_ratio > self.max_non_alpha_words_ratio:
+        non_alpha_words_count = n_words - alpha_words_count
+        if self.max_non_alpha_words_ratio and non_alpha_words_count > self.max_non_alpha_words_ratio * n_words:
             return False, "gopher_too_many_non_alpha"
 
-      
-
         return True
\ No newline at end of file
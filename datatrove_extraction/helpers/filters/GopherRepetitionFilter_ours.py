@@ -0,0 +1,67 @@
+from datatrove.data import Document
+from datatrove.pipeline.filters.gopher_repetition_filter import (
+    GopherRepetitionFilter as _GopherRepetitionFilter,
+    find_all_duplicate,
+    find_duplicates,
+    find_top_duplicate,
+    get_n_grams,
+)
+
+from .PrecomputeTextStats import get_text_stats, split_into_words_cached
+
+
+class GopherRepetitionFilter(_GopherRepetitionFilter):
+    """datatrove's GopherRepetitionFilter, reading its words from PrecomputeTextStats.
+
+    Same rules and thresholds as the original. The only difference is where the words come
+    from: `get_words` returns the stats of PrecomputeTextStats when available, otherwise
+    `split_into_words_cached`, so that the line-level tokenization cache is shared with
+    GopherQualityFilter. Override `get_words` to change where words come from.
+
+    `filter` is a copy of `GopherRepetitionFilter.filter` from datatrove 0.10.1, with its
+    `split_into_words(text, self.language)` call replaced by `self.get_words(doc)`, since
+    upstream has no hook for it. Re-sync it with upstream when upgrading datatrove.
+    """
+
+    def get_words(self, doc: Document) -> list[str]:
+        """Words of doc.text, as split_into_words(doc.text, self.language) would return them"""
+        stats = get_text_stats(doc)
+        if stats is not None and stats.language == self.language:
+            return stats.words
+        return split_into_words_cached(doc.text, self.language)
+
+    def filter(self, doc: Document) -> bool | tuple[bool, str]:
+        text = doc.text
+        if not text:
+            return False, "empty"
+
+        paragraphs = self.paragraph_exp.split(text.strip())
+        paragraphs_duplicates, char_duplicates = find_duplicates(paragraphs)
+        if self.dup_para_frac and paragraphs_duplicates / len(paragraphs) > self.dup_para_frac:
+            return False, "dup_para_frac"
+        if self.dup_para_char_frac and char_duplicates / len(text) > self.dup_para_char_frac:
+            return False, "dup_para_char_frac"
+
+        lines = self._line_splitter.split(text)
+        line_duplicates, char_duplicates = find_duplicates(lines)
+        if self.dup_line_frac and line_duplicates / len(lines) > self.dup_line_frac:
+            return False, "dup_line_frac"
+        if self.dup_line_char_frac and char_duplicates / len(text) > self.dup_line_char_frac:
+            return False, "dup_line_char_frac"
+
+        words = self.get_words(doc)
+
+        for n, n_frac in self.top_n_grams:
+            n_grams = get_n_grams(words, n)
+            if not n_grams:
+                continue
+            top_char_length = find_top_duplicate(n_grams)
+            if top_char_length / len(text) > n_frac:
+                return False, f"top_{n}_gram"
+
+        for n, n_frac in self.dup_n_grams:
+            n_duplicates_char = find_all_duplicate(words, n)
+            if n_duplicates_char / len(text) > n_frac:
+                return False, f"duplicated_{n}_n_grams"
+
+        return True
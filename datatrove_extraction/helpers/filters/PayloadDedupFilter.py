@@ -0,0 +1,32 @@
+import hashlib
+
+from datatrove.data import Document
+from datatrove.pipeline.filters.base_filter import BaseFilter
+from datatrove.pipeline.writers.disk_base import DiskWriter
+
+
+class PayloadDedupFilter(BaseFilter):
+    """Drop WARC records whose payload was already seen, before the expensive extraction steps.
+
+    Place it right after WarcReader: doc.text is then the raw HTML of the record, and re-crawled
+    pages or mirrors with an identical payload are removed before Trafilatura and the quality
+    filters run on them. Payloads are compared through their SHA-1 digest (20 bytes per record).
+
+    Duplicates are detected within a task, i.e. within the WARC files it reads.
+
+    Args:
+        exclusion_writer: optionally pass in a writer that will save the dropped documents
+    """
+
+    name = "🫂 Payload Dedup"
+
+    def __init__(self, exclusion_writer: DiskWriter | None = None):
+        super().__init__(exclusion_writer)
+        self.seen_digests: set[bytes] = set()
+
+    def filter(self, doc: Document) -> bool | tuple[bool, str]:
+        digest = hashlib.sha1(doc.text.encode("utf-8", "surrogatepass")).digest()
+        if digest in self.seen_digests:
+            return False, "duplicate_payload"
+        self.seen_digests.add(digest)
+        return True
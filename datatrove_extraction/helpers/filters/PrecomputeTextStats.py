@@ -0,0 +1,122 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+
+from datatrove.data import Document, DocumentsPipeline
+from datatrove.pipeline.base import PipelineStep
+from datatrove.utils.text import split_into_words
+from datatrove.utils.typeshelper import Languages
+
+
+@dataclass
+class TextStats:
+    """Splits of a document text shared by the quality filters"""
+
+    text: str
+    language: str
+    lines: list[str]
+    words: list[str]
+
+
+# Lines longer than this are tokenized without going through the cache: boilerplate (menus,
+# footers, cookie banners) is made of short lines, long ones are mostly unique paragraphs
+MAX_CACHED_LINE_LENGTH = 256
+
+
+@lru_cache(maxsize=65536)
+def _split_line_into_words(line: str, language: str) -> tuple[str, ...]:
+    return tuple(split_into_words(line, language))
+
+
+def split_into_words_cached(text: str, language: str, lines: list[str] | None = None) -> list[str]:
+    """Same words as split_into_words(text, language), tokenized line by line through an LRU cache.
+
+    The word tokenizer never merges tokens across a line break, so the words of a text are the
+    words of its lines. Lines repeated across documents (boilerplate of a same website) are then
+    only tokenized once per worker.
+
+    Args:
+        text: Text to split into words
+        language: Language code for tokenization
+        lines: text.splitlines(), if already computed
+    """
+    if lines is None:
+        lines = text.splitlines()
+    words = []
+    for line in lines:
+        if len(line) > MAX_CACHED_LINE_LENGTH:
+            words.extend(split_into_words(line, language))
+        else:
+            words.extend(_split_line_into_words(line, language))
+    return words
+
+
+# Stats are kept out of doc.metadata so that writers (including the exclusion writers of
+# datatrove's own filters) never serialize them. Entries are keyed by the identity of the
+# text they were computed on, which the entry keeps alive, so an id cannot be reused.
+_TEXT_STATS_CACHE: OrderedDict[int, TextStats] = OrderedDict()
+
+
+def get_text_stats(doc: Document) -> TextStats | None:
+    """Return the precomputed stats of doc, or None if missing or computed on a previous version of its text"""
+    stats = _TEXT_STATS_CACHE.get(id(doc.text))
+    if stats is not None and stats.text is doc.text:
+        return stats
+    return None
+
+
+class PrecomputeTextStats(PipelineStep):
+    """Split each document into lines and words once, for all the quality filters that follow.
+
+    Without it GopherRepetitionFilter and GopherQualityFilter each run the word tokenizer on
+    the same text, and GopherQualityFilter and C4QualityFilter each split it into lines.
+    Filters read the stats with `get_text_stats` and recompute them when they are missing or
+    stale (a previous step rewrote `doc.text`, as C4QualityFilter does).
+
+    Words are tokenized line by line through an LRU cache (see `split_into_words_cached`), so
+    boilerplate lines shared by many documents are only tokenized once.
+
+    Only the stats of the last `cache_size` documents are kept, and those of a previous task are
+    dropped when the step starts. They are not dropped when the input runs out: GopherQualityFilter
+    is then still filling its last batch and reads them afterwards. Use `check_text_stats_cache`
+    to make sure no filter batches more documents than are kept.
+
+    Args:
+        language: Language code for tokenization, must match the one of the filters
+        cache_size: Maximum number of documents whose stats are kept in memory. Must be at least
+            the batch size of GopherQualityFilter (1000 by default), the filter that reads them last
+    """
+
+    name = "📐 Precompute Text Stats"
+    type = "📊 - STATS"
+
+    def __init__(self, language: str = Languages.moroccan_arabic, cache_size: int = 1000):
+        super().__init__()
+        self.language = language
+        self.cache_size = cache_size
+
+    def run(self, data: DocumentsPipeline, rank: int = 0, world_size: int = 1) -> DocumentsPipeline:
+        _TEXT_STATS_CACHE.clear()
+        for doc in data:
+            with self.track_time():
+                text = doc.text
+                lines = text.splitlines()
+                _TEXT_STATS_CACHE[id(text)] = TextStats(
+                    text, self.language, lines, split_into_words_cached(text, self.language, lines)
+                )
+                while len(_TEXT_STATS_CACHE) > self.cache_size:
+                    _TEXT_STATS_CACHE.popitem(last=False)
+            yield doc
+
+
+def check_text_stats_cache(pipeline: list) -> None:
+    """Raise ValueError if a step after PrecomputeTextStats batches more documents than it keeps stats for"""
+    cache_size = None
+    for step in pipeline:
+        if isinstance(step, PrecomputeTextStats):
+            cache_size = step.cache_size
+        elif cache_size is not None and getattr(step, "batch_size", 1) > cache_size:
+            raise ValueError(
+                f"{step.name} batches {step.batch_size} documents but PrecomputeTextStats only keeps "
+                f"the stats of {cache_size}, raise its cache_size"
+            )
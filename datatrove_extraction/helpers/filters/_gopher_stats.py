@@ -0,0 +1,83 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional, the pure NumPy path is used without it
+    njit = None
+
+from datatrove.utils.text import PUNCTUATION_SET
+
+
+ARABIC_RANGES = (
+    (0x0600, 0x06FF),  # Arabic
+    (0x0750, 0x077F),  # Arabic Supplement
+    (0x08A0, 0x08FF),  # Arabic Extended-A
+)
+
+# Lookup table indexed by code point: True if the character is alphabetic or Arabic script
+ALPHA_LUT = np.char.isalpha(np.arange(0x110000, dtype=np.uint32).view("<U1"))
+for _start, _end in ARABIC_RANGES:
+    ALPHA_LUT[_start : _end + 1] = True
+
+# issuperset() runs over the characters of a word in C, faster on a frozenset than on datatrove's set
+PUNCTUATION_FROZENSET = frozenset(PUNCTUATION_SET)
+
+# Lookup table indexed by code point: True if the character is punctuation, for the Numba kernel
+PUNCTUATION_LUT = np.zeros(0x110000, dtype=bool)
+PUNCTUATION_LUT[[ord(ch) for ch in PUNCTUATION_SET]] = True
+
+
+if njit is not None:
+
+    @njit(cache=True, boundscheck=False)
+    def _word_flags_kernel(codes, starts, ends, alpha_lut, punctuation_lut):
+        """Flag words (codes[starts[w]:ends[w]]) with a non-punctuation char, and with an alpha char"""
+        is_non_symbol = np.zeros(len(starts), dtype=np.bool_)
+        is_alpha = np.zeros(len(starts), dtype=np.bool_)
+        for w in range(len(starts)):
+            non_symbol = False
+            alpha = False
+            for i in range(starts[w], ends[w]):
+                code = codes[i]
+                if not non_symbol and not punctuation_lut[code]:
+                    non_symbol = True
+                if not alpha and alpha_lut[code]:
+                    alpha = True
+                if non_symbol and alpha:
+                    break
+            is_non_symbol[w] = non_symbol
+            is_alpha[w] = alpha
+        return is_non_symbol, is_alpha
+
+else:
+    _word_flags_kernel = None
+
+
+def word_flags(words: list[str], word_lengths: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Classify words for the Gopher quality rules.
+
+    With Numba, a single compiled pass over the code points of all the words computes both
+    flags. Without it, punctuation-only words are found with frozenset.issuperset and
+    alphabetic words with ALPHA_LUT and np.logical_or.reduceat.
+
+    Args:
+        words: Non-empty words, e.g. of a whole batch of documents
+        word_lengths: len() of each word
+
+    Returns:
+        (is_non_symbol, is_alpha): bool arrays, True for words with at least one character that
+        is not punctuation, and for words with at least one alphabetic or Arabic character
+    """
+    if not words:
+        return np.zeros(0, dtype=bool), np.zeros(0, dtype=bool)
+    codes = np.frombuffer("".join(words).encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    word_ends = np.cumsum(word_lengths)
+    word_starts = word_ends - word_lengths
+    if _word_flags_kernel is not None:
+        return _word_flags_kernel(codes, word_starts, word_ends, ALPHA_LUT, PUNCTUATION_LUT)
+    is_non_symbol = np.fromiter(
+        (not PUNCTUATION_FROZENSET.issuperset(w) for w in words), dtype=bool, count=len(words)
+    )
+    # Words are never empty, so every reduceat segment has at least one char
+    is_alpha = np.logical_or.reduceat(ALPHA_LUT[codes], word_starts)
+    return is_non_symbol, is_alpha
@@ -0,0 +1,52 @@
+import time
+from typing import IO
+
+import orjson
+from datatrove.pipeline.writers.jsonl import JsonlWriter
+
+
+class BufferedJsonlWriter(JsonlWriter):
+    """JsonlWriter that buffers serialized documents and writes them to their file in one call.
+
+    The default JsonlWriter issues one write (and one compressor call) per document, which adds
+    up on network filesystems. Here the lines of each output file are kept in memory and written
+    together every `flush_interval` seconds or every `max_buffered` documents, whichever comes
+    first. Everything left is written before a file is closed.
+
+    Args:
+        flush_interval: Maximum number of seconds a document stays in the buffer (checked on write)
+        max_buffered: Maximum number of documents kept in the buffer of a file
+        **kwargs: JsonlWriter arguments. With `max_file_size`, file sizes are only checked
+            against flushed data, so a file can go over it by up to one buffer
+    """
+
+    name = "🐿 Jsonl (buffered)"
+
+    def __init__(self, *args, flush_interval: float = 1.0, max_buffered: int = 8192, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+        self._buffers: dict[IO, list[bytes]] = {}
+        self._last_flush = time.monotonic()
+
+    def _write(self, document: dict, file_handler: IO, _filename: str):
+        buffer = self._buffers.setdefault(file_handler, [])
+        buffer.append(orjson.dumps(document, option=orjson.OPT_APPEND_NEWLINE))
+        if len(buffer) >= self.max_buffered or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered documents of every file"""
+        for file_handler, buffer in self._buffers.items():
+            if buffer:
+                file_handler.write(b"".join(buffer))
+        self._buffers.clear()
+        self._last_flush = time.monotonic()
+
+    def close_file(self, filename):
+        self.flush()
+        super().close_file(filename)
+
+    def close(self):
+        self.flush()
+        super().close()
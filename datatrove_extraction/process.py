@@ -1,28 +1,37 @@
-from datatrove.pipeline.readers import WarcReader
-from datatrove.pipeline.writers.jsonl import JsonlWriter
+import os
+
 from datatrove.pipeline.extractors import Trafilatura
 from datatrove.executor import LocalPipelineExecutor
 from datatrove.utils.typeshelper import Languages
 from datatrove.pipeline.tokens import TokensCounter
 from datatrove.pipeline.filters import (
-    GopherRepetitionFilter, 
     LanguageFilter, 
 )
 
+from helpers.readers.WarcReader_ours import WarcReader
+from helpers.writers.BufferedJsonlWriter import BufferedJsonlWriter
+from helpers.filters.PayloadDedupFilter import PayloadDedupFilter
+from helpers.filters.EmptyDocFilter import EmptyDocFilter
 from helpers.filters.GopherQualityFilter_ours import GopherQualityFilter
+from helpers.filters.GopherRepetitionFilter_ours import GopherRepetitionFilter
 from helpers.filters.C4QualityFilter_ours import C4QualityFilter
 from helpers.filters.FineWebFilter_ours import FineWebQualityFilter
 from helpers.filters.ArabicNormalizationFilter import ArabicNormalizationFilter
+from helpers.filters.PrecomputeTextStats import PrecomputeTextStats, check_text_stats_cache
 from helpers.extra_helpers.validateInputs import validate_inputs
 from pathlib import Path
 
+# Listed once: the number of files sets the number of tasks below
 try:
-    validate_inputs()
+    warc_files = validate_inputs()
 except (FileNotFoundError, ValueError) as e:
     print(f"Validation error: {e}")
+    warc_files = []
 
 OUTPUT_BASE_PATH = Path(__file__).parent / "output"
 REJECTED_FOLDER = "rejected"
+# Documents per GopherQualityFilter batch, also the number of documents PrecomputeTextStats keeps
+GOPHER_BATCH_SIZE = 1000
 input_path=Path(__file__).parent / "input"
 model_cache_path=Path(__file__).parent.parent / "models_cache"
 
@@ -31,47 +40,66 @@ def main():
         WarcReader(
             data_folder=str(input_path),
             glob_pattern="*.warc.gz",
-            limit=10
+        ),
+        # Identical payloads (re-crawled pages, mirrors) are dropped before the extraction. Only within
+        # a task, i.e. a WARC file: a page re-crawled into another WARC file is kept in both
+        PayloadDedupFilter(
+            exclusion_writer=BufferedJsonlWriter(f"{OUTPUT_BASE_PATH}/{REJECTED_FOLDER}/0_payload_dedup"),
         ),
         Trafilatura(favour_precision=True, timeout=30),    # to use recall: favour_precision=False, favour_recall=True
+        # Near-empty extractions would all be rejected by the quality filters, drop them before tokenization
+        EmptyDocFilter(
+            exclusion_writer=BufferedJsonlWriter(f"{OUTPUT_BASE_PATH}/{REJECTED_FOLDER}/1_empty_doc"),
+            min_chars=30,
+        ),
 
         ArabicNormalizationFilter(
-            exclusion_writer=JsonlWriter(f"{OUTPUT_BASE_PATH}/{REJECTED_FOLDER}/1_arabic_norm"),
+            exclusion_writer=BufferedJsonlWriter(f"{OUTPUT_BASE_PATH}/{REJECTED_FOLDER}/2_arabic_norm"),
         ),
-        
+
+        # Split lines/words once for the quality filters below
+        PrecomputeTextStats(language=Languages.moroccan_arabic, cache_size=GOPHER_BATCH_SIZE),
+
+        # Filters that keep the text unchanged run by ascending cost / reject rate
+        # (see helpers/extra_helpers/filter_costs.py): Gopher Quality is cheaper and rejects more
+        GopherQualityFilter(
+            exclusion_writer=BufferedJsonlWriter(f"{OUTPUT_BASE_PATH}/{REJECTED_FOLDER}/3_gopher_qual"),
+            batch_size=GOPHER_BATCH_SIZE,
+        ),
+
         GopherRepetitionFilter(              
-            exclusion_writer=JsonlWriter(
-                f"{OUTPUT_BASE_PATH}/{REJECTED_FOLDER}/2_gopher_rep"
+            exclusion_writer=BufferedJsonlWriter(
+                f"{OUTPUT_BASE_PATH}/{REJECTED_FOLDER}/4_gopher_rep"
             ),
             language=Languages.moroccan_arabic
         ),
 
-        GopherQualityFilter(
-            exclusion_writer=JsonlWriter(f"{OUTPUT_BASE_PATH}/{REJECTED_FOLDER}/3_gopher_qual")
-        ),
-
         C4QualityFilter(
-            exclusion_writer=JsonlWriter(f"{OUTPUT_BASE_PATH}/{REJECTED_FOLDER}/4_c4_qual"),
+            exclusion_writer=BufferedJsonlWriter(f"{OUTPUT_BASE_PATH}/{REJECTED_FOLDER}/5_c4_qual"),
         ),
 
         FineWebQualityFilter(
-            exclusion_writer=JsonlWriter(f"{OUTPUT_BASE_PATH}/{REJECTED_FOLDER}/5_fineweb_qual")
+            exclusion_writer=BufferedJsonlWriter(f"{OUTPUT_BASE_PATH}/{REJECTED_FOLDER}/6_fineweb_qual")
         ),
 
         TokensCounter(
             tokenizer_name_or_path=str(model_cache_path / "aragpt2_base_tokenizer" / "tokenizer.json"),
         ),
         
-        JsonlWriter(
+        BufferedJsonlWriter(
             output_folder=f"{OUTPUT_BASE_PATH}/data",
         )
     ]
+    check_text_stats_cache(pipeline)
 
+    # One task per WARC file (WarcReader shards the files across tasks), run on all the cores.
+    # Writers name their files after the rank they are given (BaseFilter.run passes the task rank),
+    # so tasks don't write to the same file as long as no step writes with a fixed rank
     executor = LocalPipelineExecutor(
         pipeline=pipeline,
         logging_dir=f"{OUTPUT_BASE_PATH}/log",
-        tasks=1,
-        workers=1
+        tasks=max(1, len(warc_files)),
+        workers=os.cpu_count() or 1
     )
 
     try: